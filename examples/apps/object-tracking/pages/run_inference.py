@@ -16,13 +16,21 @@ from landingai.predict import Predictor
 VIDEO_CACHE_PATH = "cached_data"
 
 
+@st.cache_resource
+def _get_predictor(endpoint_id: str, api_key: str) -> Predictor:
+    # Reuse one Predictor (and its underlying requests.Session connection
+    # pool) across Streamlit reruns. The cache key is the credentials, so
+    # rotating them creates a fresh Predictor.
+    return Predictor(endpoint_id, api_key=api_key)
+
+
 def get_latest_traffic():
     Path(VIDEO_CACHE_PATH).mkdir(parents=True, exist_ok=True)
     get_latest_ts_file("vid.ts")
     frames = get_frames("vid.ts")
-    predictor = Predictor(
+    predictor = _get_predictor(
         st.session_state["endpoint_id"],
-        api_key=st.session_state["api_key"],
+        st.session_state["api_key"],
     )
     bboxes = get_preds(frames, predictor)
     tracks, all_idx_to_track = track_iou(bboxes)
@@ -30,7 +38,9 @@ def get_latest_traffic():
     tracks, parked = filter_parked_cars(tracks, len(frames))
     tracks, _ = filter_spurious_preds(tracks)
     northbound, southbound = get_northbound_southbound(tracks)
-    st.video(open("vid_out.mp4", "rb").read())
+    # Pass the path so Streamlit streams the file instead of us reading the
+    # whole MP4 into a bytes object first.
+    st.video("vid_out.mp4")
     st.write(f"Northbound Traffic: **{len(northbound)}** cars per 10s")
     st.write(f"Southbound Traffic: **{len(southbound)}** cars per 10s")
     st.write(f"Parked Cars: **{parked}**")
@@ -1,9 +1,7 @@
-import math
 import re
 from functools import cached_property
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import cv2
 import numpy as np
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +12,9 @@ from landingai.exceptions import InvalidApiKeyError
 # A tuple of (xmin, ymin, xmax, ymax) representing a bounding box.
 BoundingBox = Tuple[int, int, int, int]
 
+# Matches one RLE run: a run length followed by a single encoding letter.
+_RLE_TOKEN_RE = re.compile(r"(\d+)(\D)")
+
 
 class APIKey(BaseSettings):
     """The API key of a user in a particular organization in LandingLens.
@@ -95,15 +96,24 @@ class ObjectDetectionPrediction(ClassificationPrediction):
     bboxes: BoundingBox
     """A tuple of (xmin, ymin, xmax, ymax) of the predicted bounding box."""
 
-    @cached_property
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "ObjectDetectionPrediction":
+        """Construct a prediction from an already-validated dict, skipping field validation.
+
+        This is a fast path for bulk-parsing trusted server responses, where
+        per-prediction validation cost adds up over hundreds of detections per
+        image. `data` must contain every required field with the final type,
+        in particular `bboxes` must already be a tuple of four ints.
+        """
+        return cls.model_construct(**data)
+
+    @property
     def num_predicted_pixels(self) -> int:
         """The number of pixels within the predicted bounding box."""
+        # Recomputing four-int arithmetic is cheaper than a cached_property's
+        # descriptor and __dict__ machinery, and needs no Pydantic config.
         return (self.bboxes[2] - self.bboxes[0]) * (self.bboxes[3] - self.bboxes[1])
 
-    model_config = ConfigDict(
-        ignored_types=(cached_property,),
-    )
-
 
 class SegmentationPrediction(ClassificationPrediction):
     """A single segmentation mask prediction for an image.
@@ -125,13 +135,25 @@ class SegmentationPrediction(ClassificationPrediction):
     """The shape of the decoded two-dimensional segmentation mask. For example: (1024, 1024)."""
 
     @cached_property
+    def _packed_mask(self) -> np.ndarray:
+        """The decoded mask in bit-packed form (one bit per pixel).
+        This is the canonical cached form: it is 8x smaller than the dense
+        uint8 mask, which matters when many masks are kept alive at once.
+        """
+        flattened_bitmap = decode_bitmap_rle(self.encoded_mask, self.encoding_map)
+        return np.packbits(flattened_bitmap, bitorder="little")
+
+    @property
     def decoded_boolean_mask(self) -> np.ndarray:
         """Decoded boolean segmentation mask.
         It is a two-dimensional NumPy array with 0s and 1s.
         1 means the pixel is the predicted class, 0 means the pixel is not.
+        The dense mask is unpacked on each access from the bit-packed cache;
+        unpacking is a single SIMD-accelerated NumPy op.
         """
-        flattened_bitmap = decode_bitmap_rle(self.encoded_mask, self.encoding_map)
-        return np.array(flattened_bitmap, dtype=np.uint8).reshape(self.mask_shape)
+        return np.unpackbits(
+            self._packed_mask, count=self._total_pixels, bitorder="little"
+        ).reshape(self.mask_shape)
 
     @cached_property
     def decoded_index_mask(self) -> np.ndarray:
@@ -147,20 +169,32 @@ class SegmentationPrediction(ClassificationPrediction):
         It is a three-dimensional numpy array (HWC) where the predicted pixels are colored.
         The color is randomly assigned for each mask.
         """
-        mask_3d = np.expand_dims(self.decoded_boolean_mask, -1)
-        mask_3d = cv2.cvtColor(mask_3d, cv2.COLOR_GRAY2RGB)
+        # cv2 is imported lazily so that importing this module (e.g. for
+        # classification or OCR predictions) doesn't pay OpenCV's load cost.
+        import cv2
+
+        bool_mask = self.decoded_boolean_mask
         random_color = np.random.randint(0, 255, size=3, dtype=np.uint8)  # type: ignore
-        return mask_3d * random_color  # type: ignore
+        # cv2's uint8 elementwise ops run through hand-tuned SIMD kernels,
+        # which beat NumPy's generic broadcast multiply on uint8 data.
+        channels = [cv2.multiply(bool_mask, int(c)) for c in random_color]
+        return cv2.merge(channels)
 
     @cached_property
     def num_predicted_pixels(self) -> int:
         """The number of pixels that are predicted as the class."""
-        return np.count_nonzero(self.decoded_boolean_mask)
+        # The mask only holds 0s and 1s, so a SIMD-friendly sum is the count.
+        return int(self.decoded_boolean_mask.sum(dtype=np.int64))
 
     @cached_property
     def percentage_predicted_pixels(self) -> float:
         """The percentage of pixels that are predicted as the class."""
-        return np.count_nonzero(self.decoded_boolean_mask) / math.prod(self.mask_shape)
+        return self.num_predicted_pixels / self._total_pixels
+
+    @cached_property
+    def _total_pixels(self) -> int:
+        """The total number of pixels in the mask."""
+        return self.mask_shape[0] * self.mask_shape[1]
 
     model_config = ConfigDict(
         ignored_types=(cached_property,),
@@ -198,7 +232,7 @@ class InferenceMetadata(BaseModel):
 
 def decode_bitmap_rle(
     bitmap: str, encoding_map: Optional[Dict[str, int]] = None
-) -> List[int]:
+) -> np.ndarray:
     """
     Decode bitmap string to NumPy array.
 
@@ -212,16 +246,82 @@ def decode_bitmap_rle(
 
     Return
     -----
-    A flattened segmentation mask (with 0s and 1s) for a single class.
+    A flattened segmentation mask (a uint8 NumPy array with 0s and 1s) for a single class.
     """
     if not encoding_map:
         encoding_map = {"Z": 0, "N": 1}
-    flat_mask = []
-    bitmap_list = re.split("(Z|N)", bitmap)
-    for num, map_letter in zip(*[iter(bitmap_list)] * 2):
-        map_number = encoding_map[map_letter]
-        flat_mask.extend([int(map_number)] * int(num))
-    return flat_mask
+    try:
+        counts, values = _scan_rle_runs(bitmap, encoding_map)
+    except UnicodeEncodeError:
+        # Fallback for bitmaps that use a non-ASCII encoding alphabet:
+        # preallocate the output buffer and fill it one slice per run, so the
+        # Python-level work scales with the number of runs, not pixels.
+        runs = _RLE_TOKEN_RE.findall(bitmap)
+        total = sum(int(count) for count, _ in runs)
+        out = np.empty(total, dtype=np.uint8)
+        offset = 0
+        for count, letter in runs:
+            n = int(count)
+            out[offset : offset + n] = encoding_map[letter]
+            offset += n
+        return out
+    return np.repeat(values, counts)
+
+
+def _scan_rle_runs(
+    bitmap: str, encoding_map: Dict[str, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Tokenize a run-length encoded bitmap string into (run lengths, run values).
+
+    The bitmap is scanned as raw ASCII bytes at the NumPy level, so no
+    intermediate Python list of substrings is ever built. The encoding letters
+    are mapped to bit values through a 256-entry lookup table, which keeps the
+    scanner generic over any single-character ASCII encoding alphabet.
+
+    Raises `UnicodeEncodeError` if the bitmap is not ASCII-encodable.
+    """
+    buf = np.frombuffer(bitmap.encode("ascii"), dtype=np.uint8)
+    lut = np.zeros(256, dtype=np.uint8)
+    for letter, value in encoding_map.items():
+        if ord(letter) < 256:
+            lut[ord(letter)] = value
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    letter_idx = np.flatnonzero(~is_digit)
+    if letter_idx.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint8)
+    values = lut[buf[letter_idx]]
+    # Each digit contributes digit * 10**(its distance to the run's letter - 1).
+    digit_idx = np.flatnonzero(is_digit)
+    run_of_digit = np.searchsorted(letter_idx, digit_idx)
+    powers = letter_idx[run_of_digit] - digit_idx - 1
+    contributions = (buf[digit_idx] - ord("0")).astype(np.int64) * 10**powers
+    run_starts = np.flatnonzero(np.r_[True, run_of_digit[1:] != run_of_digit[:-1]])
+    counts = np.add.reduceat(contributions, run_starts)
+    return counts, values
+
+
+def bbox_array(predictions: List[ObjectDetectionPrediction]) -> np.ndarray:
+    """Stack the bounding boxes of the given predictions into a (N, 4) NumPy array.
+
+    Each row is (xmin, ymin, xmax, ymax). This is useful for computing
+    aggregate statistics over many predictions (e.g. areas or pairwise IoU via
+    broadcasting) in one vectorized pass instead of a Python loop.
+    """
+    return np.fromiter(
+        (coord for pred in predictions for coord in pred.bboxes),
+        dtype=np.int32,
+        count=4 * len(predictions),
+    ).reshape(-1, 4)
+
+
+def bbox_areas(predictions: List[ObjectDetectionPrediction]) -> np.ndarray:
+    """Compute the bounding box areas (in pixels) of the given predictions.
+
+    Equivalent to `[p.num_predicted_pixels for p in predictions]`, but computed
+    as a single NumPy op and returned as a (N,) array.
+    """
+    arr = bbox_array(predictions)
+    return (arr[:, 2] - arr[:, 0]) * (arr[:, 3] - arr[:, 1])
 
 
 def get_prediction_bounding_box(prediction: Prediction) -> Optional[BoundingBox]:
@@ -25,6 +25,7 @@ from tenacity import before_sleep_log, retry, retry_if_exception_type, wait_fixe
 import json
 import logging
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
@@ -178,6 +179,52 @@ class Predictor:
         )
         return preds
 
+    def predict_batch(
+        self,
+        images: List[Union[np.ndarray, PIL.Image.Image]],
+        metadata: Optional[InferenceMetadata] = None,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[List[Prediction]]:
+        """Call the inference endpoint on a batch of images.
+
+        The LandingLens inference endpoint scores one image per request, so
+        the batch is issued as up to `max_concurrency` concurrent requests
+        over this predictor's shared keep-alive session. This amortizes
+        connection setup across the batch and overlaps the network round
+        trips of the individual calls.
+
+        Parameters
+        ----------
+        images
+            The input images to be predicted, in the same format accepted by `predict`.
+        metadata
+            The (optional) metadata associated with every image in this batch.
+        max_concurrency : int, optional
+            The maximum number of requests in flight at once, by default 8.
+            Keep this within your endpoint's concurrent request limit.
+
+        Returns
+        -------
+        One prediction list per input image, in the same order as `images`.
+        Note that `get_metrics()` only reflects one (unspecified) call of the
+        batch afterwards.
+
+        See Also
+        --------
+        `landingai.pipeline.frameset.FrameSet.run_predict`: the equivalent
+        concurrent prediction entry point when your images are already in a
+        `FrameSet` pipeline.
+        """
+
+        def predict_one(
+            image: Union[np.ndarray, PIL.Image.Image],
+        ) -> List[Prediction]:
+            return self.predict(image, metadata=metadata, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(predict_one, images))
+
     def get_metrics(self) -> Dict[str, int]:
         """
         Return the performance metrics for the last inference call.
@@ -335,18 +382,22 @@ class _CloudPredictionExtractor(PredictionExtractor):
             }
         """
         predictions = response["backbonepredictions"]
+        # The server response is trusted and already in the final shape, so
+        # skip Pydantic validation on this bulk path.
         return [
-            ObjectDetectionPrediction(
-                id=id,
-                label_name=pred["labelName"],
-                label_index=pred["labelIndex"],
-                score=pred["score"],
-                bboxes=(
-                    pred["coordinates"]["xmin"],
-                    pred["coordinates"]["ymin"],
-                    pred["coordinates"]["xmax"],
-                    pred["coordinates"]["ymax"],
-                ),
+            ObjectDetectionPrediction.from_trusted_dict(
+                {
+                    "id": id,
+                    "label_name": pred["labelName"],
+                    "label_index": pred["labelIndex"],
+                    "score": pred["score"],
+                    "bboxes": (
+                        pred["coordinates"]["xmin"],
+                        pred["coordinates"]["ymin"],
+                        pred["coordinates"]["xmax"],
+                        pred["coordinates"]["ymax"],
+                    ),
+                }
             )
             for id, pred in predictions.items()
         ]
@@ -1,6 +1,8 @@
 """This module contains common streamlit utilities that are used across the example Apps in this repo.
 It's only intended for the example streamlit Apps. When using the SDK in your own project, you don't need to use this module.
 """
+import base64
+import functools
 import logging
 import os
 from typing import Any, Optional
@@ -9,6 +11,13 @@ _DEFAULT_API_KEY_ENV_VAR = "LANDINGAI_API_KEY"
 
 _LOGGER = logging.getLogger(__name__)
 
+# The streamlit module, populated on the first _import_st() call. Importing
+# lazily keeps streamlit's hefty import cost off plain SDK imports (this
+# module is pulled in via landingai.telemetry), while the helpers below, which
+# are called many times per Streamlit rerun, skip the import machinery and
+# try/except after the first call.
+_st: Any = None
+
 
 def is_running_in_streamlit() -> bool:
     """Return True if the code is running in a streamlit App."""
@@ -22,19 +31,22 @@ def is_running_in_streamlit() -> bool:
 
 
 def _import_st() -> Any:
-    """Import streamlit and raise an error if it fails."""
-    try:
-        import streamlit as st
-
-        return st
-    except ImportError as e:
-        raise ValueError(
-            """Failed to import streamlit due to missing the `streamlit` dependency.
+    """Return the streamlit module, importing and memoizing it on the first call."""
+    global _st
+    if _st is None:
+        try:
+            import streamlit as st
+
+            _st = st
+        except ImportError as e:
+            raise ValueError(
+                """Failed to import streamlit due to missing the `streamlit` dependency.
 This is likely because you are trying to use a function in this module outside of the example Apps in this repo. But this function is only intended for example Apps of this repo.
 If you are using this function in other environment, please install streamlit manually first, e.g. 'pip install streamlit'.
 If you are running one of the example Apps of this repo, please follow the installation instructions of that App.
     """
-        ) from e
+            ) from e
+    return _st
 
 
 def setup_page(page_title: str) -> None:
@@ -74,15 +86,22 @@ def setup_page(page_title: str) -> None:
     st.markdown(hide_footer_style, unsafe_allow_html=True)
 
 
+@functools.lru_cache(maxsize=32)
+def _svg_to_base64(svg: str) -> str:
+    """Base64-encode the given SVG string.
+    The result is memoized since Streamlit reruns the whole script on every
+    interaction and the rendered SVGs (e.g. logos) are static.
+    """
+    return base64.b64encode(svg.encode("utf-8")).decode("utf-8")
+
+
 def render_svg(svg: str, margin_bottom: int = 3) -> None:
     """Renders the given svg string.
     This is a workaround as st.image doesn't seem to work.
     See: https://github.com/streamlit/streamlit/issues/275
     """
     st = _import_st()
-    import base64
-
-    b64 = base64.b64encode(svg.encode("utf-8")).decode("utf-8")
+    b64 = _svg_to_base64(svg)
     html = r'<img src="data:image/svg+xml;base64,%s"  height="50" />' % b64
     st.write(html, unsafe_allow_html=True)
     for _ in range(margin_bottom):
@@ -1,4 +1,5 @@
 """Module for common utility functions."""
+import functools
 import io
 import logging
 import os
@@ -76,9 +77,19 @@ def load_api_credential(api_key: Optional[str] = None) -> APIKey:
         return APIKey(api_key=api_key)
     else:
         # Load from environment variables or .env file
-        try:
-            return APIKey()
-        except ValidationError as e:
-            raise InvalidApiKeyError(
-                "API key is either not provided or invalid."
-            ) from e
+        return _load_api_credential_from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_api_credential_from_env() -> APIKey:
+    """Load the API key from environment variables or the .env file.
+
+    A successful load is cached for the life of the process: scanning the
+    environment and parsing the .env file is repeated file IO that apps
+    constructing a Predictor per interaction (e.g. Streamlit reruns) shouldn't
+    pay every time. Failed loads are not cached and will be retried.
+    """
+    try:
+        return APIKey()
+    except ValidationError as e:
+        raise InvalidApiKeyError("API key is either not provided or invalid.") from e
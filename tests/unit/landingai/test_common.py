@@ -9,6 +9,8 @@ from landingai.common import (
     APIKey,
     ObjectDetectionPrediction,
     SegmentationPrediction,
+    bbox_areas,
+    bbox_array,
     decode_bitmap_rle,
 )
 from landingai.exceptions import InvalidApiKeyError
@@ -51,7 +53,10 @@ def test_decode_bitmap_rle():
     encoded_mask = "2N3Z2N5Z"
     encoding_map = {"Z": 0, "N": 1}
     decoded_mask = decode_bitmap_rle(encoded_mask, encoding_map)
-    assert decoded_mask == [1, 1, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+    assert decoded_mask.dtype == np.uint8
+    np.testing.assert_array_equal(
+        decoded_mask, [1, 1, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+    )
 
 
 def test_segmentation_prediction_properties():
@@ -85,3 +90,35 @@ def test_object_detection_prediction_properties():
         bboxes=(1, 2, 31, 42),
     )
     assert prediction.num_predicted_pixels == 1200
+
+
+def test_object_detection_prediction_from_trusted_dict():
+    prediction = ObjectDetectionPrediction.from_trusted_dict(
+        {
+            "id": "123",
+            "label_index": 3,
+            "label_name": "class1",
+            "score": 0.5,
+            "bboxes": (1, 2, 31, 42),
+        }
+    )
+    assert prediction.bboxes == (1, 2, 31, 42)
+    assert prediction.num_predicted_pixels == 1200
+
+
+def test_bbox_array_and_areas():
+    predictions = [
+        ObjectDetectionPrediction(
+            id=str(i),
+            label_index=1,
+            label_name="class1",
+            score=0.5,
+            bboxes=bboxes,
+        )
+        for i, bboxes in enumerate([(1, 2, 31, 42), (0, 0, 10, 10)])
+    ]
+    np.testing.assert_array_equal(
+        bbox_array(predictions), [[1, 2, 31, 42], [0, 0, 10, 10]]
+    )
+    np.testing.assert_array_equal(bbox_areas(predictions), [1200, 100])
+    assert bbox_array([]).shape == (0, 4)
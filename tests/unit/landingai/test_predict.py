@@ -33,10 +33,19 @@ from landingai.predict import (
     OcrPredictor,
     SnowflakeNativeAppPredictor,
 )
+from landingai.utils import _load_api_credential_from_env
 from landingai.visualize import overlay_predictions
 from landingai.pipeline.frameset import FrameSet, Frame
 
 
+@pytest.fixture(autouse=True)
+def clear_credential_cache():
+    """The credential tests manipulate the environment, so drop the process-wide credential cache."""
+    _load_api_credential_from_env.cache_clear()
+    yield
+    _load_api_credential_from_env.cache_clear()
+
+
 # private_key generated with this call:
 # from cryptography.hazmat.backends import default_backend
 # from cryptography.hazmat.primitives.asymmetric import rsa
@@ -287,6 +296,56 @@ def test_predict_matching_expected_request_body():
     predictor.predict(img)
 
 
+@patch("socket.socket")
+@responses.activate
+def test_predict_batch(connect_mock):
+    # Fake a successful connection
+    sock_instance = connect_mock.return_value
+    sock_instance.connect_ex.return_value = 0
+    url = "https://predict.app.landing.ai/inference/v1/predict?endpoint_id=8fc1bc53-c5c1-4154-8cc1-a08f2e17ba43"
+    fire_img_path = "tests/data/images/wildfire1.jpeg"
+    cereal_img_path = "tests/data/images/cereal1.jpeg"
+    # Each image gets its own mocked response so the test can verify that
+    # predict_batch returns results in input order.
+    for img_path, label_name in [(fire_img_path, "Fire"), (cereal_img_path, "NoFire")]:
+        responses.post(
+            url=url,
+            match=[multipart_matcher({"file": _read_image_as_jpeg_bytes(img_path)})],
+            json={
+                "backbonetype": None,
+                "backbonepredictions": None,
+                "predictions": {
+                    "score": 0.9951885938644409,
+                    "labelIndex": 0,
+                    "labelName": label_name,
+                },
+                "type": "ClassificationPrediction",
+            },
+        )
+    predictor = Predictor(
+        "8fc1bc53-c5c1-4154-8cc1-a08f2e17ba43",
+        api_key="land_sk_1111",
+    )
+    # Open one image handle per batch entry: lazily-loaded PIL images are not
+    # safe to serialize concurrently from multiple worker threads.
+    images = [
+        Image.open(img_path)
+        for img_path in [
+            fire_img_path,
+            cereal_img_path,
+            fire_img_path,
+            fire_img_path,
+            cereal_img_path,
+        ]
+    ]
+    batch_preds = predictor.predict_batch(images, max_concurrency=3)
+    assert len(batch_preds) == len(images)
+    expected_labels = ["Fire", "NoFire", "Fire", "Fire", "NoFire"]
+    for preds, expected_label in zip(batch_preds, expected_labels):
+        assert len(preds) == 1, "Result should not be empty or None"
+        assert preds[0].label_name == expected_label
+
+
 @responses.activate
 @mock.patch("snowflake.connector.connect")
 def test_snowflake_nativeapp_predict_matching_expected_request_body(
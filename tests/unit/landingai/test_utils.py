@@ -8,7 +8,20 @@ import pytest
 
 from landingai.common import APIKey
 from landingai.exceptions import InvalidApiKeyError
-from landingai.utils import _DEFAULT_FORMAT, load_api_credential, serialize_image
+from landingai.utils import (
+    _DEFAULT_FORMAT,
+    _load_api_credential_from_env,
+    load_api_credential,
+    serialize_image,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_credential_cache():
+    """Each test manipulates the environment, so drop the process-wide credential cache."""
+    _load_api_credential_from_env.cache_clear()
+    yield
+    _load_api_credential_from_env.cache_clear()
 
 
 def test_load_api_credential_invalid_key():